@@ -1,19 +1,233 @@
 """Модуль, предоставляющий интерфейс для взаимодействия с облачным хранилищем файлов"""
 
 import logging
-import xml.etree.ElementTree as ET
-from datetime import datetime, timezone
-import sys
+from calendar import timegm
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import os
+from typing import BinaryIO
+
+from requests import Session, Response
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError, RequestException
+from urllib3.util.retry import Retry
 
-from requests import request, put, Response
-from requests.exceptions import HTTPError
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
 import utils
-import os
 
 
 py_logger = logging.getLogger(__name__)
 
+# Теги ответа PROPFIND в нотации Кларка, как их передаёт парсер
+_Q_RESPONSE = "{DAV:}response"
+_Q_DISPLAY = "{DAV:}displayname"
+_Q_SIZE = "{DAV:}getcontentlength"
+_Q_MTIME = "{DAV:}getlastmodified"
+_Q_ETAG = "{DAV:}getetag"
+_Q_PROPS = frozenset((_Q_DISPLAY, _Q_SIZE, _Q_MTIME, _Q_ETAG))
+
+# Номера месяцев по их сокращённым английским названиям из дат RFC 1123
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split(), start=1
+    )
+}
+
+
+def _parse_rfc1123(value: str) -> int:
+    """
+    Разбирает дату в формате RFC 1123, например "Mon, 02 Jun 2025 10:00:00 GMT".
+
+    Формат имеет фиксированную ширину полей, поэтому значения вырезаются
+    срезами строки без медленного datetime.strptime и сразу переводятся
+    в секунды Unix без создания объекта datetime.
+
+    Args:
+        value (str): Строка с датой из заголовка или свойства WebDAV.
+
+    Returns:
+        int: Время в секундах с начала эпохи Unix (UTC).
+    """
+
+    return timegm(
+        (
+            int(value[12:16]),
+            _MONTHS[value[8:11]],
+            int(value[5:7]),
+            int(value[17:19]),
+            int(value[20:22]),
+            int(value[23:25]),
+        )
+    )
+
+
+class YadiskError(Exception):
+    """Ошибка взаимодействия с облачным хранилищем Яндекс.Диска."""
+
+
+class AuthError(YadiskError):
+    """Некорректный токен авторизации."""
+
+
+class NotFoundError(YadiskError):
+    """Объект отсутствует в облачном хранилище."""
+
+
+class _PropfindTarget:
+    """
+    Цель потокового XML-парсера для ответа PROPFIND.
+
+    Получает события start/data/end и собирает словарь с информацией о файлах
+    без построения дерева элементов: в памяти хранятся только свойства
+    текущего объекта.
+    """
+
+    def __init__(self, is_debug: bool):
+        """
+        Инициализирует цель парсера с пустым словарём результатов.
+
+        Args:
+            is_debug (bool): Включён ли уровень логирования DEBUG.
+        """
+
+        self.result = dict()
+        self._is_debug = is_debug
+        self._is_first = True
+        self._props = dict()
+        self._text = []
+
+    def start(self, tag: str, attrib: dict[str]) -> None:
+        """
+        Обрабатывает открывающий тег: сбрасывает накопленный текст.
+
+        Args:
+            tag (str): Полное имя тега с пространством имён.
+            attrib (dict[str]): Атрибуты тега.
+        """
+
+        self._text.clear()
+
+    def data(self, data: str) -> None:
+        """
+        Накапливает текст текущего элемента, который может прийти несколькими частями.
+
+        Args:
+            data (str): Фрагмент текста.
+        """
+
+        self._text.append(data)
+
+    def end(self, tag: str) -> None:
+        """
+        Обрабатывает закрывающий тег.
+
+        Для нужных свойств сохраняет их текст, по закрытию элемента response
+        добавляет собранный объект в результат.
+
+        Args:
+            tag (str): Полное имя тега с пространством имён.
+        """
+
+        if tag == _Q_RESPONSE:
+            # Первый элемент ответа описывает сам каталог
+            if not self._is_first:
+                self._add_info()
+            self._is_first = False
+            self._props.clear()
+        elif tag in _Q_PROPS:
+            self._props[tag] = "".join(self._text)
+
+    def close(self) -> dict[str, utils.FileInfo]:
+        """
+        Завершает разбор документа.
+
+        Returns:
+            dict[str, FileInfo]: Словарь с ключами-именами файлов и значениями FileInfo.
+        """
+
+        return self.result
+
+    def _add_info(self) -> None:
+        """
+        Добавляет в словарь информацию о текущем объекте.
+
+        Папки в словарь не попадают, о них пишется предупреждение в лог.
+        """
+
+        filename = self._props.get(_Q_DISPLAY)
+        if self._is_debug:
+            py_logger.debug('Обнаружен объект "%s"', filename)
+
+        size = self._props.get(_Q_SIZE)
+        # У папок нет размера
+        if size is None:
+            py_logger.warning(
+                'Внимание: объект "%s" в облачном хранилище является папкой. '
+                "Процесс синхронизации не предусмотрен для вложенных папок",
+                filename,
+            )
+            return
+
+        size = int(size)
+        if self._is_debug:
+            py_logger.debug(
+                '"%s" имеет размер (%d байт), значит "%s" - файл',
+                filename,
+                size,
+                filename,
+            )
+
+        mtime = _parse_rfc1123(self._props[_Q_MTIME])
+
+        # ETag файла на Яндекс.Диске - MD5 его содержимого
+        md5 = self._props.get(_Q_ETAG, "").strip('"') or None
+
+        self.result[filename] = utils.FileInfo(mtime, size, md5)
+
+
+class _UploadBody:
+    """
+    Тело PUT-запроса, отдающее файл крупными блоками.
+
+    Файловый объект requests и urllib3 читают блоками по 16 КиБ, а итерируемое
+    тело передаётся в сокет теми блоками, которые отдаёт итератор. Длина
+    известна заранее, поэтому запрос уходит с Content-Length, а не chunked.
+    Каждая новая итерация начинается с начала файла, так что при повторной
+    попытке запроса тело отправляется заново целиком. Отдаётся не больше
+    заявленного размера: если файл дописали после fstat, лишние байты попали бы
+    в соединение пула как начало следующего запроса.
+    """
+
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, file: BinaryIO, size: int):
+        """
+        Инициализирует тело запроса.
+
+        Args:
+            file (BinaryIO): Файл, открытый в двоичном режиме.
+            size (int): Размер файла в байтах.
+        """
+
+        self._file = file
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[bytes]:
+        self._file.seek(0)
+        remaining = self._size
+        while remaining and (chunk := self._file.read(min(self.CHUNK_SIZE, remaining))):
+            remaining -= len(chunk)
+            yield chunk
+
 
 class YadiskAPI:
     """
@@ -24,34 +238,113 @@ class YadiskAPI:
 
     Attributes:
         BASE_URL (str): Базовый URL для WebDAV API Яндекс.Диска.
+        MAX_WORKERS (int): Число потоков для пакетных операций по умолчанию.
+        TIMEOUT (float): Таймаут соединения и ожидания данных от сервера в секундах.
 
     Methods:
+        close() -> None
+            Останавливает пул потоков, закрывает HTTP-сессию и пул соединений.
+
+        invalidate(filename: str | None = None) -> None
+            Сбрасывает кэш метаинформации после изменений в облаке.
+
         load(local_path: str, filename: str) -> None
             Загружает файл из локальной директории в облачное хранилище.
 
         reload(local_path: str, filename: str) -> None
-            Обновляет файл в облаке, предварительно удаляя старую версию.
+            Обновляет файл в облаке, перезаписывая старую версию.
 
         delete(filename: str) -> None
             Удаляет файл из облачного хранилища.
 
-        get_info() -> dict[dict[str]] | None
+        load_many(local_path: str, filenames: Iterable[str]) -> dict[str, bool]
+            Параллельно загружает несколько файлов.
+
+        reload_many(local_path: str, filenames: Iterable[str]) -> dict[str, bool]
+            Параллельно обновляет несколько файлов.
+
+        delete_many(filenames: Iterable[str]) -> dict[str, bool]
+            Параллельно удаляет несколько файлов.
+
+        get_info() -> dict[str, utils.FileInfo] | None
             Возвращает метаинформацию о файлах в облаке.
     """
 
     BASE_URL = "https://webdav.yandex.ru"
+    MAX_WORKERS = 8
+    TIMEOUT = 30.0
 
-    def __init__(self, token, cloud_path):
+    def __init__(self, token, cloud_path, max_workers: int = MAX_WORKERS):
         """
         Инициализирует объект для работы с Яндекс.Диском.
 
         Args:
             token (str): Токен авторизации для доступа к API.
             cloud_path (str): Путь к директории в облачном хранилище.
+            max_workers (int): Число потоков для пакетных операций.
         """
 
-        self.__token = token
         self.__cloud_path = cloud_path
+        # Пул потоков создаётся один раз и переиспользуется во всех циклах синхронизации
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        # Одна сессия на все запросы: соединение с сервером переиспользуется (keep-alive)
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"DELETE", "PROPFIND", "PUT"}),
+        )
+        # Размер пула совпадает с числом потоков, чтобы они не ждали свободного соединения
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=max_workers, max_retries=retries
+        )
+        self._session = Session()
+        self._session.mount("https://", adapter)
+        self._session.headers.update({"Authorization": token, "Accept": "*/*"})
+
+        # Заголовки для каждого типа запроса собираются один раз
+        # DELETE и PROPFIND отправляются без тела, поэтому Content-Type им не нужен
+        self._propfind_headers = {"Depth": "1"}
+        self._delete_headers = dict()
+        self._put_headers = {
+            "Expect": "100-continue",
+            "Content-Type": "application/binary",
+        }
+
+        # Последний разобранный ответ PROPFIND: ETag, Last-Modified, словарь.
+        # Экземпляр работает с одним каталогом, поэтому хранится одна запись.
+        # Срока жизни нет: актуальность проверяет сервер по условным заголовкам
+        self._info_cache = None
+
+    def __enter__(self) -> "YadiskAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Останавливает пул потоков, закрывает HTTP-сессию и все открытые соединения пула.
+        """
+
+        self._executor.shutdown()
+        self._session.close()
+
+    def invalidate(self, filename: str | None = None) -> None:
+        """
+        Сбрасывает кэш метаинформации каталога в облаке.
+
+        Кэш хранится для каталога целиком, поэтому изменение любого файла
+        делает неактуальным весь закэшированный список.
+
+        Args:
+            filename (str | None): Имя изменённого файла (для логирования).
+        """
+
+        if self._info_cache is not None:
+            self._info_cache = None
+            py_logger.debug('Кэш метаинформации сброшен из-за изменения "%s"', filename)
 
     def load(self, local_path: str, filename: str) -> None:
         """
@@ -66,42 +359,22 @@ class YadiskAPI:
             filename (str): Имя файла для загрузки.
         """
 
-        response = self._load(local_path, filename)
-        if response.status_code == 201:
-            py_logger.info(f'Файл "{filename}" успешно загружен.')
-        else:
-            py_logger.error(
-                f'При загрузке файла "{filename}" возникли непредвиденные проблемы'
-            )
+        self._check_load(filename, self._load(local_path, filename))
 
     def reload(self, local_path: str, filename: str) -> None:
         """
-        Обновляет файл в облаке: удаляет старую версию и загружает новую.
+        Обновляет файл в облаке: новая версия перезаписывает старую одним PUT-запросом.
 
         Логирование:
-            - DEBUG при успешном удалении старой версии
             - INFO при успешной загрузке новой версии
-            - ERROR при ошибках на любом этапе
+            - ERROR при ошибках загрузки
 
         Args:
             local_path (str): Путь к локальной директории с файлом.
             filename (str): Имя обновляемого файла.
         """
 
-        first_response = self._delete(filename)
-        if first_response.status_code != 204:
-            py_logger.error(
-                "Обновление файла невозможно: при удалении возникла непредвиденная ошибка"
-            )
-            return
-        py_logger.debug(f'Файл "{filename}" удалён в облачном хранилище')
-        second_response = self._load(local_path, filename)
-        if second_response.status_code == 201:
-            py_logger.info(f'Файл "{filename}" успешно обновлён в облачном хранилище')
-        else:
-            py_logger.error(
-                "Обновление файла невозможно: при загрузке возникла непредвиденная ошибка"
-            )
+        self._check_reload(filename, self._load(local_path, filename))
 
     def delete(self, filename: str) -> None:
         """
@@ -115,15 +388,76 @@ class YadiskAPI:
             filename (str): Имя удаляемого файла.
         """
 
-        response = self._delete(filename)
-        if response.status_code == 204:
-            py_logger.info(f'Файл "{filename}" успешно удалён.')
-        else:
-            py_logger.error(
-                f'При удалении файла "{filename}" возникли непредвиденные проблемы'
-            )
+        self._check_delete(filename, self._delete(filename))
 
-    def get_info(self) -> dict[dict[str]] | None:
+    def load_many(self, local_path: str, filenames: Iterable[str]) -> dict[str, bool]:
+        """
+        Параллельно загружает несколько файлов в облачное хранилище.
+
+        Логирование:
+            - INFO при успешной загрузке каждого файла
+            - ERROR при ошибках загрузки
+
+        Args:
+            local_path (str): Путь к локальной директории с файлами.
+            filenames (Iterable[str]): Имена файлов для загрузки.
+
+        Returns:
+            dict[str, bool]: Словарь с ключами-именами файлов и признаком успешной загрузки.
+        """
+
+        responses = self._run_many(partial(self._load, local_path), filenames)
+        return {
+            name: resp is not None and self._check_load(name, resp)
+            for name, resp in responses.items()
+        }
+
+    def reload_many(
+        self, local_path: str, filenames: Iterable[str]
+    ) -> dict[str, bool]:
+        """
+        Параллельно обновляет несколько файлов в облаке.
+
+        Логирование:
+            - INFO при успешной загрузке новой версии
+            - ERROR при ошибках загрузки
+
+        Args:
+            local_path (str): Путь к локальной директории с файлами.
+            filenames (Iterable[str]): Имена обновляемых файлов.
+
+        Returns:
+            dict[str, bool]: Словарь с ключами-именами файлов и признаком успешного обновления.
+        """
+
+        responses = self._run_many(partial(self._load, local_path), filenames)
+        return {
+            name: resp is not None and self._check_reload(name, resp)
+            for name, resp in responses.items()
+        }
+
+    def delete_many(self, filenames: Iterable[str]) -> dict[str, bool]:
+        """
+        Параллельно удаляет несколько файлов из облачного хранилища.
+
+        Логирование:
+            - INFO при успешном удалении каждого файла
+            - ERROR при ошибках удаления
+
+        Args:
+            filenames (Iterable[str]): Имена удаляемых файлов.
+
+        Returns:
+            dict[str, bool]: Словарь с ключами-именами файлов и признаком успешного удаления.
+        """
+
+        responses = self._run_many(self._delete, filenames)
+        return {
+            name: resp is not None and self._check_delete(name, resp)
+            for name, resp in responses.items()
+        }
+
+    def get_info(self) -> dict[str, utils.FileInfo] | None:
         """
         Получает метаданные о файлах в облачном хранилище.
 
@@ -133,20 +467,137 @@ class YadiskAPI:
             - ERROR при ошибках парсинга
 
         Returns:
-            dict[dict[str]]: Словарь с ключами-именами файлов и значениями:
-                'last_modified' (datetime): Время последнего изменения (UTC)
-                'size' (int): Размер файла в байтах
+            dict[str, FileInfo]: Словарь с ключами-именами файлов и значениями FileInfo:
+                mtime (int): Время последнего изменения в секундах Unix (UTC)
+                size (int): Размер файла в байтах
+                md5 (str | None): MD5 содержимого из ETag
         """
         return self._get_info()
 
+    def _run_many(
+        self, func: Callable[[str], Response], filenames: Iterable[str]
+    ) -> dict[str, Response | None]:
+        """
+        Выполняет запросы для нескольких файлов параллельно в общем пуле потоков.
+
+        Все потоки используют общую HTTP-сессию, размер пула соединений которой
+        совпадает с максимальным числом потоков. Ошибка с одним файлом не прерывает
+        обработку остальных, кроме ошибки авторизации. Это касается и ошибок
+        чтения локального файла, например если он удалён после сканирования папки.
+
+        Логирование:
+            - ERROR при ошибке запроса или чтения файла для отдельного файла.
+
+        Args:
+            func (Callable[[str], Response]): Функция, выполняющая запрос для одного файла.
+            filenames (Iterable[str]): Имена файлов.
+
+        Returns:
+            dict[str, Response | None]: Словарь с ключами-именами файлов и ответами сервера
+                (None, если запрос завершился ошибкой).
+
+        Raises:
+            AuthError: Если токен авторизации некорректен.
+        """
+
+        futures = {name: self._executor.submit(func, name) for name in filenames}
+
+        result = dict()
+        for name, future in futures.items():
+            try:
+                result[name] = future.result()
+            except AuthError:
+                raise
+            except (YadiskError, OSError) as exc:
+                py_logger.error('Операция с файлом "%s" не выполнена: %s', name, exc)
+                result[name] = None
+        return result
+
+    @staticmethod
+    def _check_load(filename: str, response: Response) -> bool:
+        """
+        Проверяет ответ на загрузку файла и логирует результат.
+
+        Логирование:
+            - INFO при успешной загрузке
+            - ERROR при ошибках загрузки
+
+        Args:
+            filename (str): Имя файла.
+            response (Response): Ответ сервера на запрос загрузки.
+
+        Returns:
+            bool: True, если файл загружен.
+        """
+
+        if response.status_code == 201:
+            py_logger.info('Файл "%s" успешно загружен.', filename)
+            return True
+        py_logger.error(
+            'При загрузке файла "%s" возникли непредвиденные проблемы', filename
+        )
+        return False
+
+    @staticmethod
+    def _check_delete(filename: str, response: Response) -> bool:
+        """
+        Проверяет ответ на удаление файла и логирует результат.
+
+        Логирование:
+            - INFO при успешном удалении
+            - ERROR при ошибках удаления
+
+        Args:
+            filename (str): Имя файла.
+            response (Response): Ответ сервера на запрос удаления.
+
+        Returns:
+            bool: True, если файл удалён.
+        """
+
+        if response.status_code == 204:
+            py_logger.info('Файл "%s" успешно удалён.', filename)
+            return True
+        py_logger.error(
+            'При удалении файла "%s" возникли непредвиденные проблемы', filename
+        )
+        return False
+
+    @staticmethod
+    def _check_reload(filename: str, response: Response) -> bool:
+        """
+        Проверяет ответ на загрузку новой версии файла при обновлении.
+
+        Логирование:
+            - INFO при успешной загрузке новой версии
+            - ERROR при ошибке загрузки
+
+        Args:
+            filename (str): Имя файла.
+            response (Response): Ответ сервера на запрос загрузки.
+
+        Returns:
+            bool: True, если файл обновлён.
+        """
+
+        # При перезаписи WebDAV-сервер может ответить как 201, так и 204
+        if response.status_code in (201, 204):
+            py_logger.info('Файл "%s" успешно обновлён в облачном хранилище', filename)
+            return True
+        py_logger.error(
+            "Обновление файла невозможно: при загрузке возникла непредвиденная ошибка"
+        )
+        return False
+
     def _load(self, local_path: str, filename: str) -> Response:
         """
         Выполняет загрузку файла в облачное хранилище через HTTP PUT запрос.
 
         Логика работы:
-            - Вычисляет MD5 и SHA256 хэши файла.
-            - Формирует заголовки с авторизацией и хэшами.
-            - Открывает файл в бинарном режиме и отправляет PUT-запрос.
+            - Открывает файл в бинарном режиме и вычисляет MD5 и SHA256 хэши.
+            - Формирует заголовки с хэшами (авторизация задана в сессии).
+            - Отправляет PUT-запрос с тем же открытым файлом, передавая
+            тело блоками по 1 МиБ с заранее известным Content-Length.
             - Возвращает ответ сервера.
 
         Логирование:
@@ -163,23 +614,24 @@ class YadiskAPI:
         """
 
         file_path = os.path.join(local_path, filename)
-        py_logger.debug(f'Подготовка к загрузке файла "{filename}"')
-        md5, sha256 = utils.calculate_hashes(file_path)
-        headers = {
-            "Accept": "*/*",
-            "Authorization": self.__token,
-            "Etag": md5,
-            "Sha256": sha256,
-            "Expect": "100-continue",
-            "Content-Type": "application/binary",
-        }
-
-        py_logger.debug(f'Открытие файла "{filename}" в двоичном режиме')
-        with open(file_path, "rb") as f:
+        py_logger.debug('Подготовка к загрузке файла "%s"', filename)
+
+        py_logger.debug('Открытие файла "%s" в двоичном режиме', filename)
+        # Файл открывается один раз: после расчёта хэшей он же отправляется в теле запроса
+        with open(file_path, "rb", buffering=0) as f:
+            md5, sha256 = utils.hash_file(f)
+            headers = self._put_headers.copy()
+            headers["Etag"] = md5
+            headers["Sha256"] = sha256
+
+            size = os.fstat(f.fileno()).st_size
+            # Пустой файл отправляется как пустое тело, иначе requests выберет chunked
+            body = _UploadBody(f, size) if size else b""
             response = self._request(
-                "PUT", f"{self.__cloud_path}/{filename}", headers=headers, data=f
+                "PUT", f"{self.__cloud_path}/{filename}", headers=headers, data=body
             )
-        py_logger.debug(f'Файл "{filename}" в двоичном режиме закрыт')
+        py_logger.debug('Файл "%s" в двоичном режиме закрыт', filename)
+        self.invalidate(filename)
         return response
 
     def _delete(self, filename: str) -> Response:
@@ -197,110 +649,140 @@ class YadiskAPI:
             Response: Объект ответа HTTP.
         """
 
-        headers = {
-            "Accept": "*/*",
-            "Authorization": self.__token,
-            "Content-Type": "application/xml",
-        }
         response = self._request(
-            "DELETE", f"{self.__cloud_path}/{filename}", headers=headers
+            "DELETE", f"{self.__cloud_path}/{filename}", headers=self._delete_headers
         )
+        self.invalidate(filename)
         return response
 
-    def _get_info(self) -> dict[dict[str]] | None:
+    def _get_info(self) -> dict[str, utils.FileInfo] | None:
         """
         Получает информацию о файлах в облачном хранилище через PROPFIND запрос.
 
         Логика работы:
-            - Формирует заголовки запроса.
-            - Отправляет PROPFIND-запрос.
-            - При успешном ответе (207) парсит XML и формирует словарь с именами файлов,
-            временем последнего изменения и размером.
+            - Формирует заголовки запроса, при наличии кэша добавляет
+            условные заголовки If-None-Match/If-Modified-Since.
+            - При ответе 304 возвращает закэшированный словарь.
+            - Отправляет PROPFIND-запрос с потоковым получением тела.
+            - При успешном ответе (207) парсит XML по мере поступления и формирует
+            словарь с именами файлов, временем последнего изменения и размером.
             - Игнорирует папки, давая предупреждения в логе.
 
         Логирование:
             - INFO при получении XML-данных.
+            - INFO при использовании кэша.
             - INFO при начале и окончании парсинга XML.
             - DEBUG при обнаружении каждого объекта.
             - WARNING при обнаружении папок.
             - ERROR при ошибках парсинга XML.
 
         Returns:
-            dict[dict[str]] | None: Словарь с метаданными файлов или None при ошибке.
+            dict[str, FileInfo] | None: Словарь с метаданными файлов или None при ошибке.
         """
 
-        headers = {
-            "Accept": "*/*",
-            "Depth": "1",
-            "Authorization": self.__token,
-            "Content-Type": "application/xml",
-        }
-
-        response = self._request("PROPFIND", self.__cloud_path, headers)
-        if response.status_code == 207:
-            py_logger.info("Получены XML-данные от Яндекс.Диска")
-        return self._make_info_dict(response)
+        headers = self._propfind_headers
+
+        cached = self._info_cache
+        if cached is not None:
+            headers = headers.copy()
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        with self._request(
+            "PROPFIND", self.__cloud_path, headers, stream=True
+        ) as response:
+            if response.status_code == 304:
+                py_logger.info("Данные в облаке не изменились, использован кэш")
+                return cached["dict"]
+            if response.status_code == 207:
+                py_logger.info("Получены XML-данные от Яндекс.Диска")
+            result = self._make_info_dict(response)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if result is not None and (etag or last_modified):
+            self._info_cache = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "dict": result,
+            }
+        return result
 
     def _request(
-        self, method: str, endpoint: str, headers: dict[str], data=None
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str],
+        data=None,
+        stream: bool = False,
     ) -> Response:
         """
         Универсальный метод для отправки HTTP-запросов к API Яндекс.Диска.
 
         Логика работы:
-            - Формирует полный URL, отправляет запрос.
-            - Проверяет статус ответа, при ошибках логирует и завершает программу с сообщением.
+            - Формирует полный URL, отправляет запрос через общую сессию.
+            - Проверяет статус ответа, при ошибках авторизации и отсутствии объекта
+            выбрасывает исключение, решение о продолжении работы принимает вызывающий код.
             - Возвращает объект ответа при успешном выполнении.
 
         Логирование:
             - DEBUG при отправке запроса и получении ответа.
-            - CRITICAL при ошибках HTTP с указанием типа ошибки.
-            - ERROR с трассировкой стека при неизвестных ошибках.
+            - ERROR с трассировкой стека при прочих HTTP-ошибках.
 
         Args:
             method (str): HTTP-метод (GET, PUT, DELETE, PROPFIND и т.д.).
             endpoint (str): Относительный путь к ресурсу в облаке.
             headers (dict[str]): Заголовки запроса.
             data (optional): Тело запроса (для PUT и др.).
+            stream (bool): Не загружать тело ответа сразу, а читать его потоком.
 
         Returns:
             Response: Объект ответа HTTP.
 
         Raises:
-            SystemExit: Завершает программу с кодом 1 при непредвиденных HTTP-ошибках.
+            AuthError: Если токен авторизации некорректен (401).
+            NotFoundError: Если объекта нет в облачном хранилище (404).
+            YadiskError: При сетевых ошибках, таймаутах и исчерпании повторных попыток.
         """
 
         try:
-            response = request(
-                method, f"{self.BASE_URL}/{endpoint}", headers=headers, data=data
+            response = self._session.request(
+                method,
+                f"{self.BASE_URL}/{endpoint}",
+                headers=headers,
+                data=data,
+                stream=stream,
+                timeout=self.TIMEOUT,
             )
             py_logger.debug("Запрос отправлен на сервер Яндекс.Диска")
             response.raise_for_status()
             py_logger.debug("Получен ответ от Яндекс.Диска")
-        except HTTPError:
-            message = "HTTP Error"
+        except HTTPError as exc:
             if response.status_code == 401:
-                message = "Некорректный токен"
-            elif response.status_code == 404:
-                message = f'Объекта "{endpoint}" не существует в облачном хранилище'
-            else:
-                py_logger.exception(message)
-                return response
-            py_logger.critical(message, exc_info=True)
-            sys.exit(1)
+                raise AuthError("Некорректный токен") from exc
+            if response.status_code == 404:
+                raise NotFoundError(
+                    f'Объекта "{endpoint}" не существует в облачном хранилище'
+                ) from exc
+            py_logger.exception("HTTP Error")
+            return response
+        except RequestException as exc:
+            raise YadiskError(f'Запрос {method} "{endpoint}" не выполнен: {exc}') from exc
 
         return response
 
     @staticmethod
-    def _make_info_dict(response: Response) -> dict[dict[str]] | None:
+    def _make_info_dict(response: Response) -> dict[str, utils.FileInfo] | None:
         """
         Парсит XML-ответ от PROPFIND запроса и формирует словарь с информацией о файлах.
 
         Логика работы:
-            - Парсит XML с помощью ElementTree.
-            - Пропускает первый элемент (корневой каталог).
-            - Для каждого файла извлекает имя, размер и дату последнего изменения.
-            - Логирует предупреждения для папок.
+            - Передаёт тело ответа блоками по мере чтения из сокета в потоковый
+            парсер lxml (или ElementTree, если lxml не установлен).
+            - Парсер не строит дерево элементов: события разбора обрабатывает
+            _PropfindTarget, сразу формируя итоговый словарь.
 
         Логирование:
             - INFO при начале и завершении парсинга XML.
@@ -309,49 +791,34 @@ class YadiskAPI:
             - ERROR при ошибках парсинга XML.
 
         Args:
-            response (Response): HTTP-ответ с XML телом.
+            response (Response): Потоковый HTTP-ответ с XML телом.
 
         Returns:
-            dict[dict[str]] | None: Словарь с ключами-именами файлов и значениями:
-                'last_modified' (datetime): Время последнего изменения (UTC).
-                'size' (int): Размер файла в байтах.
+            dict[str, FileInfo] | None: Словарь с ключами-именами файлов и значениями FileInfo:
+                mtime (int): Время последнего изменения в секундах Unix (UTC).
+                size (int): Размер файла в байтах.
+                md5 (str | None): MD5 содержимого из ETag.
             Возвращает None, если парсинг невозможен.
+
+        Raises:
+            YadiskError: Если соединение оборвалось во время чтения тела ответа.
         """
 
-        result = dict()
+        py_logger.info("Начат парсинг XML-ответа.")
+        # Уровень логирования проверяется один раз, а не для каждого объекта
+        target = _PropfindTarget(is_debug=py_logger.isEnabledFor(logging.DEBUG))
+        parser = ET.XMLParser(target=target)
         try:
-            root = ET.fromstring(response.text)
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                parser.feed(chunk)
+            result = parser.close()
         except ET.ParseError:
-            py_logger.error("Тело ответа пустое, парсинг XML невозможен.")
+            py_logger.error("Тело ответа пустое или повреждено, парсинг XML невозможен.")
             return
-
-        py_logger.info("Начат парсинг XML-ответа.")
-        for tag in root.findall("{DAV:}response/{DAV:}propstat/{DAV:}prop")[1:]:
-            filename = tag.find("{DAV:}displayname").text
-            py_logger.debug(f'Обнаружен объект "{filename}"')
-
-            try:
-                size = int(tag.find("{DAV:}getcontentlength").text)
-                py_logger.debug(
-                    f'"{filename}" имеет размер ({size} байт), значит "{filename}" - файл'
-                )
-            except AttributeError:
-                message = (
-                    'Внимание: объект "{name}" в облачном хранилище является папкой. '
-                    "Процесс синхронизации не предусмотрен для вложенных папок".format(
-                        name=tag.find("{DAV:}displayname").text
-                    )
-                )
-                py_logger.warning(message)
-                continue
-
-            yandex_last_modified = tag.find("{DAV:}getlastmodified").text
-            dt_last_modified = datetime.strptime(
-                yandex_last_modified, "%a, %d %b %Y %H:%M:%S GMT"
-            ).replace(tzinfo=timezone.utc)
-
-            result[filename] = {"last_modified": dt_last_modified, "size": size}
+        except RequestException as exc:
+            # Тело читается потоком уже после _request, поэтому сетевые ошибки ловятся здесь
+            raise YadiskError(f"Чтение ответа PROPFIND прервано: {exc}") from exc
 
         py_logger.info("Завершён парсинг XML-ответа от Яндекс.Диска")
-        py_logger.debug(f"Обнаружено файлов в облачном хранилище: {len(result)}")
+        py_logger.debug("Обнаружено файлов в облачном хранилище: %d", len(result))
         return result
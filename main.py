@@ -7,16 +7,36 @@
     initialize() -> None
         Инициализирует конфигурацию, настраивает логирование и запускает бесконечный цикл синхронизации.
 
-    infinite_sync(yapi: YadiskAPI, local_path: str, sync_period: float) -> None
+    infinite_sync(yapi: YadiskAPI, local_path: str, sync_period: float, state_path: str | None = None, scanner: Executor | None = None) -> None
         Запускает бесконечный цикл синхронизации файлов между локальной папкой и облаком с заданным периодом.
+
+    sync(yapi: YadiskAPI, local_path: str, state_path: str | None = None, scanner: Executor | None = None) -> None
+        Выполняет один цикл синхронизации.
+
+    wait_changes(local_path: str, sync_period: float) -> Iterator[set]
+        Ожидает изменений в локальной папке не дольше заданного периода.
+
+    setup_logging(log_path: str, log_format: str) -> None
+        Настраивает запись лога в файл через очередь и отдельный поток.
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
 import time
+from collections.abc import Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    from watchfiles import watch
+except ImportError:
+    watch = None
 
 import utils
-from api import YadiskAPI
+from api import AuthError, YadiskAPI, YadiskError
 
 
 def initialize() -> None:
@@ -27,8 +47,11 @@ def initialize() -> None:
         - Загружает конфигурацию из файла с помощью utils.get_config().
         - Проверяет корректность конфигурации через utils.raise_for_config().
         - При ошибках загрузки конфигурации записывает критическую ошибку в лог и завершает программу.
-        - Настраивает логирование в файл, путь к которому указан в конфигурации.
-        - Создаёт объект API для работы с Яндекс.Диском.
+        - Настраивает логирование в файл, путь к которому указан в конфигурации,
+        через очередь, чтобы потоки синхронизации не ждали записи на диск.
+        - Загружает сохранённый кэш MD5 локальных файлов.
+        - Создаёт объект API для работы с Яндекс.Диском с заданным числом потоков
+        и поток для сканирования локальной папки; они закрываются при завершении программы.
         - Запускает бесконечный цикл синхронизации с указанным периодом.
 
     Raises:
@@ -39,56 +62,192 @@ def initialize() -> None:
     try:
         config = utils.get_config()
         utils.raise_for_config(config)
-    except (FileNotFoundError, KeyError) as exc:
+    except (FileNotFoundError, KeyError, ValueError) as exc:
         logging.basicConfig(filename="config_load.log", format=log_format)
         logging.critical(exc)
         sys.exit(1)
     else:
         config = config["Yandex"]
 
-    log_path = config["log_path"]
-    logging.basicConfig(filename=log_path, format=log_format, level=logging.DEBUG)
+    setup_logging(config["log_path"], log_format)
 
     sync_period = float(config["sync_period"]) * 60
-    yapi = YadiskAPI(token=config["token"], cloud_path=config["cloud_path"])
-    infinite_sync(yapi, config["local_path"], sync_period)
+    max_workers = int(config.get("max_workers") or YadiskAPI.MAX_WORKERS)
+    state_path = config.get("state_path") or "state.sqlite"
+    utils.load_md5_cache(state_path)
+    # Сессия с пулом соединений и поток сканирования локальной папки живут
+    # все циклы синхронизации и закрываются при выходе
+    with (
+        YadiskAPI(
+            token=config["token"],
+            cloud_path=config["cloud_path"],
+            max_workers=max_workers,
+        ) as yapi,
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="local-scan") as scanner,
+    ):
+        infinite_sync(yapi, config["local_path"], sync_period, state_path, scanner)
+
+
+def setup_logging(log_path: str, log_format: str) -> None:
+    """
+    Настраивает логирование в файл через очередь.
+
+    Корневой логгер только кладёт записи в очередь, а в файл их пишет отдельный
+    поток QueueListener, поэтому рабочие потоки не блокируются на дисковом вводе-выводе
+    и не ждут друг друга на блокировке обработчика. При завершении программы
+    оставшиеся записи дописываются в файл.
 
+    Args:
+        log_path (str): Путь к файлу лога.
+        log_format (str): Формат записей лога.
+    """
 
-def infinite_sync(yapi: YadiskAPI, local_path: str, sync_period: float) -> None:
+    file_handler = logging.FileHandler(log_path)
+    file_handler.setFormatter(logging.Formatter(log_format))
+    log_queue = queue.SimpleQueue()
+    # Запись форматируется окончательно в потоке QueueListener
+    logging.basicConfig(
+        handlers=[QueueHandler(log_queue)], format="%(message)s", level=logging.DEBUG
+    )
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+def infinite_sync(
+    yapi: YadiskAPI,
+    local_path: str,
+    sync_period: float,
+    state_path: str | None = None,
+    scanner: Executor | None = None,
+) -> None:
     """
     Запускает бесконечный цикл синхронизации локальной папки с облачным хранилищем.
 
     Логика работы:
         - Получает список файлов в облаке и локальной папке.
         - Сравнивает списки и формирует задачи для удаления, загрузки и перезагрузки файлов.
-        - Выполняет соответствующие операции через API.
-        - Ждёт заданный период и повторяет процесс.
+        - Выполняет соответствующие операции через API пакетами, ошибка с одним файлом
+        не прерывает обработку остальных.
+        - При ошибке получения списка облачных файлов пропускает цикл синхронизации.
+        - Ждёт изменений в локальной папке, но не дольше заданного периода,
+        и повторяет процесс.
 
     Args:
         yapi (YadiskAPI): Объект API для взаимодействия с Яндекс.Диском.
         local_path (str): Путь к локальной директории для синхронизации.
-        sync_period (float): Период синхронизации в секундах.
+        sync_period (float): Максимальный период между синхронизациями в секундах.
+        state_path (str | None): Путь к базе SQLite для сохранения кэша MD5.
+        scanner (Executor | None): Пул для сканирования локальной папки параллельно
+            с запросом к облаку.
+
+    Raises:
+        SystemExit: Завершает программу с кодом 1 при некорректном токене.
     """
 
+    # Наблюдатель создаётся один раз, чтобы не терять изменения, сделанные во время синхронизации
+    changes = wait_changes(local_path, sync_period)
     logging.info("Первая синхронизация")
     while True:
         logging.info("Синхронизация начата")
-        cloud_dict = yapi.get_info()
-        logging.info("Получен список облачных файлов")
-        local_dict = utils.get_info(local_path)
-        logging.info("Получен список локальных файлов")
-        todo_dict = utils.compare_cloud_local(cloud_dict, local_dict)
-        logging.info("Получен список задач для синхронизации")
+        try:
+            sync(yapi, local_path, state_path, scanner)
+        except AuthError as exc:
+            logging.critical(exc, exc_info=True)
+            sys.exit(1)
+        except YadiskError:
+            logging.exception("Синхронизация прервана, повтор в следующем цикле")
+        if next(changes):
+            logging.info("Обнаружены изменения в локальной папке")
+
+
+def wait_changes(local_path: str, sync_period: float) -> Iterator[set]:
+    """
+    Ожидает изменений в локальной папке.
+
+    Если установлен watchfiles, изменения отслеживаются через уведомления ОС
+    (inotify, FSEvents, ReadDirectoryChangesW) без опроса диска, и очередная
+    синхронизация начинается сразу после изменения. Если изменений нет,
+    генератор всё равно срабатывает раз в sync_period, чтобы полная
+    синхронизация восстанавливала пропущенные события. Без watchfiles
+    генератор просто ждёт sync_period.
+
+    Args:
+        local_path (str): Путь к локальной директории.
+        sync_period (float): Максимальное время ожидания в секундах.
 
-        for file in todo_dict["delete"]:
-            yapi.delete(file)
-        for file in todo_dict["load"]:
-            yapi.load(local_path, file)
-        for file in todo_dict["reload"]:
-            yapi.reload(local_path, file)
+    Yields:
+        set: Набор изменений; пустой, если истёк период ожидания.
+    """
+
+    if watch is None:
+        logging.debug("watchfiles не установлен, используется периодический опрос")
+        while True:
+            time.sleep(sync_period)
+            yield set()
+    yield from watch(
+        local_path,
+        recursive=False,
+        rust_timeout=int(sync_period * 1000),
+        yield_on_timeout=True,
+    )
+
+
+def sync(
+    yapi: YadiskAPI,
+    local_path: str,
+    state_path: str | None = None,
+    scanner: Executor | None = None,
+) -> None:
+    """
+    Выполняет один цикл синхронизации локальной папки с облачным хранилищем.
+
+    Если передан пул scanner, список локальных файлов собирается в нём параллельно
+    с запросом списка облачных, так что время цикла определяется более долгим из двух.
+
+    Args:
+        yapi (YadiskAPI): Объект API для взаимодействия с Яндекс.Диском.
+        local_path (str): Путь к локальной директории для синхронизации.
+        state_path (str | None): Путь к базе SQLite для сохранения кэша MD5.
+        scanner (Executor | None): Пул для сканирования локальной папки.
+            Если не передан, папка сканируется после запроса к облаку.
 
+    Raises:
+        YadiskError: Если не удалось получить список облачных файлов.
+    """
+
+    if scanner is not None:
+        # Локальная папка сканируется в отдельном потоке, пока ожидается ответ облака
+        local_future = scanner.submit(utils.get_info, local_path)
+        cloud_dict = yapi.get_info()
+        local_dict = local_future.result()
+    else:
+        cloud_dict = yapi.get_info()
+        local_dict = utils.get_info(local_path)
+    if cloud_dict is None:
+        logging.error("Список облачных файлов не получен, синхронизация пропущена")
+        return
+    logging.info("Получены списки облачных и локальных файлов")
+    todo_dict = utils.compare_cloud_local(cloud_dict, local_dict, local_path)
+    logging.info("Получен список задач для синхронизации")
+    if state_path is not None:
+        present = (os.path.join(local_path, name) for name in local_dict)
+        utils.save_md5_cache(state_path, present)
+
+    report = yapi.delete_many(todo_dict["delete"])
+    report |= yapi.load_many(local_path, todo_dict["load"])
+    report |= yapi.reload_many(local_path, todo_dict["reload"])
+
+    failed = [name for name, is_done in report.items() if not is_done]
+    if failed:
+        logging.warning(
+            "Синхронизация завершена частично: не выполнено %d из %d операций (%s)",
+            len(failed),
+            len(report),
+            ", ".join(sorted(failed)),
+        )
+    else:
         logging.info("Синхронизация завершена")
-        time.sleep(sync_period)
 
 
 if __name__ == "__main__":
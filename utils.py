@@ -4,43 +4,83 @@
 Содержит функции для загрузки и проверки конфигурации, получения информации о локальных файлах,
 сравнения локальных и облачных файлов, а также вычисления контрольных сумм файлов.
 
+Классы:
+    FileInfo
+        Метаинформация о файле: время последнего изменения, размер и MD5.
+
 Функции:
-    get_config(filename: str = 'config.ini') -> ConfigParser
+    get_config(filename: str = 'config.ini') -> dict[str, dict[str, str]]
         Загружает конфигурационный файл.
 
-    raise_for_config(config: ConfigParser) -> None
+    raise_for_config(config: dict[str, dict[str, str]]) -> None
         Проверяет наличие обязательных параметров в конфигурации.
 
-    get_info(path: str) -> dict[str, dict[str]]
+    get_info(path: str) -> dict[str, FileInfo]
         Получает информацию о файлах в локальной директории.
 
-    compare_cloud_local(cloud: dict[str, dict[str]], local: dict[str, dict[str]]) -> dict[str, set]
+    compare_cloud_local(cloud: dict[str, FileInfo], local: dict[str, FileInfo], local_path: str | None = None) -> dict[str, set]
         Сравнивает списки файлов из облака и локальной папки, формирует задачи для синхронизации.
 
-    calculate_hashes(file_path: str, chunk_size=8192) -> tuple[str, str]
-        Вычисляет MD5 и SHA256 хэши файла.
+    calculate_md5(file_path: str) -> str
+        Вычисляет MD5 локального файла с кэшированием по размеру и времени изменения в наносекундах.
+
+    load_md5_cache(db_path: str) -> None
+        Загружает сохранённый кэш MD5 локальных файлов из базы SQLite.
+
+    save_md5_cache(db_path: str, present: Iterable[str] | None = None) -> None
+        Сохраняет новые записи кэша MD5 в базу SQLite и удаляет записи об исчезнувших файлах.
+
+    hash_file(f: BinaryIO, chunk_size=1 << 20) -> tuple[str, str]
+        Вычисляет MD5 и SHA256 хэши уже открытого файла.
 """
 
 import logging
 import os
 import hashlib
-from datetime import datetime, timezone
+import sqlite3
+from functools import lru_cache
+from collections.abc import Iterable
+from typing import BinaryIO, NamedTuple
 
-from configparser import ConfigParser, NoOptionError, NoSectionError
+from configparser import ConfigParser
 
 
 py_logger = logging.getLogger(__name__)
 
+# Кэш MD5 локальных файлов: путь -> (размер, время изменения в наносекундах, MD5)
+_md5_cache: dict[str, tuple[int, int, str]] = dict()
+# Пути, записи о которых ещё не сохранены в базу
+_md5_dirty: set[str] = set()
+
+
+class FileInfo(NamedTuple):
+    """
+    Метаинформация о файле, по которой сравниваются облачная и локальная версии.
 
-def get_config(filename: str = "config.ini") -> ConfigParser:
+    Attributes:
+        mtime (int): Время последнего изменения файла в секундах Unix (UTC).
+        size (int): Размер файла в байтах.
+        md5 (str | None): MD5 содержимого, если он известен без чтения файла.
+    """
+
+    mtime: int
+    size: int
+    md5: str | None = None
+
+
+@lru_cache(maxsize=1)
+def get_config(filename: str = "config.ini") -> dict[str, dict[str, str]]:
     """
     Загружает конфигурационный файл.
 
+    Файл разбирается один раз, повторные вызовы с тем же именем файла
+    возвращают тот же словарь, поэтому изменять его не следует.
+
     Args:
         filename (str): Путь к конфигурационному файлу. По умолчанию 'config.ini'.
 
     Returns:
-        ConfigParser: Объект с загруженной конфигурацией.
+        dict[str, dict[str, str]]: Словарь секций, каждая секция - словарь параметров.
 
     Raises:
         FileNotFoundError: Если файл конфигурации не найден.
@@ -50,49 +90,57 @@ def get_config(filename: str = "config.ini") -> ConfigParser:
         raise FileNotFoundError(f'Конфигурационный файл "{filename}" не обнаружен!')
     config = ConfigParser()
     config.read(filename)
-    return config
+    return {section: dict(config[section]) for section in config.sections()}
 
 
-def raise_for_config(config: ConfigParser) -> None:
+def raise_for_config(config: dict[str, dict[str, str]]) -> None:
     """
     Выбрасывает ошибку, если нет секции 'Yandex', параметры конфигурационного файла не инициализированы или отсутствуют.
 
     Args:
-        config (ConfigParser): Объект конфигурации.
+        config (dict[str, dict[str, str]]): Конфигурация из get_config().
 
     Raises:
         KeyError: Если отсутствует секция 'Yandex' или обязательные параметры не инициализированы.
+        ValueError: Если max_workers задан, но не является положительным целым числом.
     """
 
     not_null_keys = ("local_path", "sync_period", "log_path", "token")
     may_null_keys = ("cloud_path",)
 
-    if not config.has_section("Yandex"):
+    section = config.get("Yandex")
+    if section is None:
         raise KeyError('Секция "Yandex" отсутствует в конфигурационном файле')
     for key in not_null_keys:
-        if not config["Yandex"].get(key, fallback=None):
+        if not section.get(key):
             raise KeyError(
                 f"Параметр {key} не инициализирован или отсутствует в конфигурационном файле"
             )
     for key in may_null_keys:
-        if config["Yandex"].get(key, fallback=None) is None:
+        if key not in section:
             raise KeyError(f"Параметр {key} отсутствует в конфигурационном файле")
+    max_workers = section.get("max_workers")
+    if max_workers and not (max_workers.isdigit() and int(max_workers) > 0):
+        raise ValueError(
+            "Параметр max_workers должен быть положительным целым числом, "
+            f"получено {max_workers!r}"
+        )
 
 
-def get_info(path: str) -> dict[str, dict[str]]:
+def get_info(path: str) -> dict[str, FileInfo]:
     """
     Получает информацию о файлах в локальной директории.
 
-    Для каждого файла в директории собирает словарь с датой последнего изменения и размером файла.
+    Для каждого файла в директории собирает дату последнего изменения и размер файла.
     Игнорирует вложенные папки, при этом выводит предупреждение в лог.
 
     Args:
         path (str): Путь к локальной директории.
 
     Returns:
-        dict[str, dict[str]]: Словарь, где ключ - имя файла, значение - словарь с ключами:
-            'last_modified' (datetime): Время последнего изменения файла (UTC, без микросекунд).
-            'size' (int): Размер файла в байтах.
+        dict[str, FileInfo]: Словарь, где ключ - имя файла, значение - FileInfo с полями:
+            mtime (int): Время последнего изменения файла в секундах Unix (UTC).
+            size (int): Размер файла в байтах.
 
     Raises:
         NotADirectoryError: Если указанный путь не является директорией.
@@ -101,42 +149,44 @@ def get_info(path: str) -> dict[str, dict[str]]:
     if not os.path.isdir(path):
         raise NotADirectoryError(f'"{path}" не является папкой')
     result = dict()
-    for file in os.listdir(path):
-        if os.path.isdir(os.path.join(path, file)):
-            message = (
-                'Внимание: локальный объект "{name}" является папкой. '
-                "Процесс синхронизации не предусмотрен для вложенных папок".format(
-                    name=file
+    # scandir отдаёт тип объекта из самого чтения каталога, а stat кэшируется в DirEntry
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                py_logger.warning(
+                    'Внимание: локальный объект "%s" является папкой. '
+                    "Процесс синхронизации не предусмотрен для вложенных папок",
+                    entry.name,
                 )
-            )
-            py_logger.warning(message)
-            continue
-
-        file_info = os.stat(os.path.join(path, file))
-        # Конвертирует время из системы в datetime, обрезая микросекунды
-        dt_last_modified = datetime.fromtimestamp(
-            file_info.st_mtime, timezone.utc
-        ).replace(microsecond=0)
-        # Собирает словарь для последующего сравнения с таким же от интерфейса для Яндекс Диска
-        result[file] = {
-            "last_modified": dt_last_modified,
-            "size": int(file_info.st_size),
-        }
-    py_logger.debug(f"Обнаружено файлов в локальном хранилище: {len(result)}")
+                continue
+
+            file_info = entry.stat()
+            # Целые секунды: облако хранит время изменения с точностью до секунды
+            mtime = file_info.st_mtime_ns // 1_000_000_000
+            # Собирает словарь для последующего сравнения с таким же от интерфейса для Яндекс Диска
+            result[entry.name] = FileInfo(mtime, file_info.st_size)
+    py_logger.debug("Обнаружено файлов в локальном хранилище: %d", len(result))
     return result
 
 
 def compare_cloud_local(
-    cloud: dict[str, dict[str]], local: dict[str, dict[str]]
+    cloud: dict[str, FileInfo],
+    local: dict[str, FileInfo],
+    local_path: str | None = None,
 ) -> dict[str, set[str]]:
     """
     Сравнивает списки файлов из облака и локальной директории, формирует задачи для синхронизации.
 
     Определяет файлы, которые нужно загрузить в облако, обновить или удалить.
+    Файл обновляется, если отличается размер, либо если локальная версия новее
+    облачной и её MD5 не совпадает с облачным. Локальный MD5 считается только
+    в последнем случае и только при известном пути к директории.
 
     Args:
-        cloud (dict[str, dict[str]]): Информация о файлах в облаке.
-        local (dict[str, dict[str]]): Информация о локальных файлах.
+        cloud (dict[str, FileInfo]): Информация о файлах в облаке.
+        local (dict[str, FileInfo]): Информация о локальных файлах.
+        local_path (str | None): Путь к локальной директории для сверки содержимого по MD5.
+            Если не указан, файлы одинакового размера сравниваются только по времени изменения.
 
     Returns:
         dict[str, set[str]]: Словарь, содержащий сеты (множества) ключей:
@@ -145,39 +195,174 @@ def compare_cloud_local(
             'delete' (set): Файлы, которые есть в облаке, но отсутствуют локально.
     """
 
+    # Представления ключей поддерживают операции над множествами без копирования в set
+    cloud_keys = cloud.keys()
+    local_keys = local.keys()
     # Первый тур: поиск файлов, которых нет или в облаке, или локально
-    not_in_cloud = set(local.keys()) - set(cloud.keys())
-    if not_in_cloud:
-        py_logger.debug("Обнаружены файлы, отсутствующие в облаке")
-    not_in_local = set(cloud.keys()) - set(local.keys())
-    if not_in_local:
-        py_logger.debug("Обнаружены файлы, которых нет локально")
+    not_in_cloud = local_keys - cloud_keys
+    not_in_local = cloud_keys - local_keys
     # Второй тур: сравнение файлов с одинаковыми именами
-    same_names = set(cloud.keys()) & set(local.keys())
+    same_names = cloud_keys & local_keys
+    # Размер и время сравниваются прямо по полям кортежей, без вызова функции на каждый файл;
+    # до сверки содержимого по MD5 доходят только файлы того же размера, изменённые локально
     reload = {
         name
-        for name in same_names
-        if cloud[name]["size"] != local[name]["size"]
-        or cloud[name]["last_modified"] < local[name]["last_modified"]
+        for name, cloud_info, local_info in (
+            (name, cloud[name], local[name]) for name in same_names
+        )
+        if cloud_info.size != local_info.size
+        or (
+            cloud_info.mtime < local_info.mtime
+            and _is_content_changed(cloud_info, local_path, name)
+        )
     }
-    if reload:
-        py_logger.debug("Обнаружены файлы, которые нужно обновить в облаке")
     # Подготовка списка задач в формате словаря
     result = {"load": not_in_cloud, "reload": reload, "delete": not_in_local}
-    py_logger.debug("Список задач для синхронизации подготовлен")
+    # Одна итоговая запись вместо сообщения на каждую категорию
+    py_logger.debug(
+        "Список задач для синхронизации подготовлен: загрузить %d, обновить %d, удалить %d",
+        len(not_in_cloud),
+        len(reload),
+        len(not_in_local),
+    )
     return result
 
 
-def calculate_hashes(file_path: str, chunk_size=8192) -> tuple[str, str]:
+def _is_content_changed(
+    cloud_info: FileInfo, local_path: str | None, name: str
+) -> bool:
     """
-    Вычисляет MD5 и SHA256 хэши файла.
+    Проверяет, отличается ли содержимое локального файла от облачного при равном размере.
 
-    Читает файл по частям заданного размера и обновляет оба хэша.
+    Args:
+        cloud_info (FileInfo): Информация о файле в облаке.
+        local_path (str | None): Путь к локальной директории для сверки по MD5.
+        name (str): Имя файла.
+
+    Returns:
+        bool: True, если содержимое отличается или его нельзя сверить.
+            False, если файл недоступен: например, удалён после сканирования папки.
+            Такой файл будет обработан в следующем цикле синхронизации.
+    """
+
+    if cloud_info.md5 is None or local_path is None:
+        return True
+    file_path = os.path.join(local_path, name)
+    try:
+        return calculate_md5(file_path) != cloud_info.md5
+    except OSError as exc:
+        py_logger.warning('Не удалось сверить MD5 файла "%s", пропущен: %s', name, exc)
+        return False
+
+
+def calculate_md5(file_path: str) -> str:
+    """
+    Вычисляет MD5 локального файла.
+
+    Результат кэшируется по пути к файлу и пересчитывается, только если
+    изменились размер или время последнего изменения файла. Время сравнивается
+    в наносекундах: правка того же размера в пределах одной секунды
+    не должна вернуть устаревший MD5.
 
     Args:
         file_path (str): Путь к файлу.
-        chunk_size (int): Размер блока чтения в байтах. По умолчанию 8192, что исторически обусловлено
-            оптимальным соотношением между частотой обращений к памяти и скоростью передачи
+
+    Returns:
+        str: MD5 файла в шестнадцатеричном формате.
+    """
+
+    stat = os.stat(file_path)
+    cached = _md5_cache.get(file_path)
+    if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+        return cached[2]
+    with open(file_path, "rb", buffering=0) as f:
+        # Ключ кэша берётся до чтения: запись во время расчёта изменит время и сбросит кэш
+        stat = os.fstat(f.fileno())
+        md5 = hashlib.file_digest(f, "md5").hexdigest()
+    _md5_cache[file_path] = (stat.st_size, stat.st_mtime_ns, md5)
+    _md5_dirty.add(file_path)
+    py_logger.debug('Рассчитан MD5 файла "%s"', file_path)
+    return md5
+
+
+def load_md5_cache(db_path: str) -> None:
+    """
+    Загружает сохранённый кэш MD5 локальных файлов из базы SQLite.
+
+    Благодаря этому после перезапуска программы не пересчитываются хэши файлов,
+    которые не менялись. Если базы нет, она создаётся.
+
+    Args:
+        db_path (str): Путь к файлу базы SQLite.
+    """
+
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files "
+                "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, md5 TEXT)"
+            )
+        rows = conn.execute("SELECT path, size, mtime_ns, md5 FROM files").fetchall()
+    finally:
+        conn.close()
+
+    for path, size, mtime_ns, md5 in rows:
+        _md5_cache[path] = (size, mtime_ns, md5)
+    py_logger.debug("Загружено записей кэша MD5: %d", len(rows))
+
+
+def save_md5_cache(db_path: str, present: Iterable[str] | None = None) -> None:
+    """
+    Сохраняет в базу SQLite записи кэша MD5, появившиеся с прошлого сохранения.
+
+    Если передан список существующих файлов, записи о путях не из него удаляются
+    и из памяти, и из базы, чтобы кэш не рос за счёт удалённых файлов.
+    Все изменения пишутся одним пакетом в одной транзакции.
+
+    Args:
+        db_path (str): Путь к файлу базы SQLite.
+        present (Iterable[str] | None): Полные пути файлов из последнего сканирования.
+    """
+
+    stale = _md5_cache.keys() - set(present) if present is not None else set()
+    if not _md5_dirty and not stale:
+        return
+    for path in stale:
+        del _md5_cache[path]
+    _md5_dirty.difference_update(stale)
+    rows = [(path, *_md5_cache[path]) for path in _md5_dirty]
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            conn.executemany(
+                "DELETE FROM files WHERE path = ?", [(path,) for path in stale]
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, md5) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+    finally:
+        conn.close()
+    _md5_dirty.clear()
+    py_logger.debug(
+        "Сохранено записей кэша MD5: %d, удалено: %d", len(rows), len(stale)
+    )
+
+
+def hash_file(f: BinaryIO, chunk_size=1 << 20) -> tuple[str, str]:
+    """
+    Вычисляет MD5 и SHA256 хэши уже открытого файла, читая его с текущей позиции.
+
+    Читает файл за один проход в заранее выделенный буфер заданного размера
+    и обновляет оба хэша одним и тем же блоком данных без лишних копирований.
+    Позволяет посчитать хэши и затем отправить файл, не открывая его повторно.
+
+    Args:
+        f (BinaryIO): Файл, открытый в двоичном режиме.
+        chunk_size (int): Размер буфера чтения в байтах. По умолчанию 1 МиБ: крупный блок
+            сокращает число системных вызовов read и вызовов хэш-функций
 
     Returns:
         tuple[str, str]: Кортеж из двух строк - MD5 и SHA256 хэши файла в шестнадцатеричном формате.
@@ -185,9 +370,11 @@ def calculate_hashes(file_path: str, chunk_size=8192) -> tuple[str, str]:
 
     md5 = hashlib.md5()
     sha256 = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            md5.update(chunk)
-            sha256.update(chunk)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+
+    while size := f.readinto(buffer):
+        md5.update(view[:size])
+        sha256.update(view[:size])
     py_logger.debug("Расчёт суммы MD5 и хэша SHA256 завершён")
     return md5.hexdigest(), sha256.hexdigest()